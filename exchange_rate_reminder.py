@@ -1,18 +1,24 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import atexit
 import platform
 import requests
+import sys
 import time
 import subprocess
 import os
 import shutil
 import json
 import argparse
+import importlib.util
+import string
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from datetime import datetime, timedelta
-from dotenv import load_dotenv
-from threshold_calculator import DynamicThresholdCalculator
+from typing import Final
+from datetime import date, datetime, timedelta
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # ============================================================================
 # Configuration
@@ -23,9 +29,14 @@ class Config:
     # API settings
     USE_FRANKFURTER_FIRST = True
     API_TIMEOUT = 10
+    # All pair rates are derived from one response quoted in this currency
+    BASE_HUB = "USD"
+    # Reuse fetched rates for this long (kept shorter than the check interval)
+    RATES_CACHE_TTL_SECONDS = 300
     
     # Monitoring settings
-    CHECK_INTERVAL_MINUTES = 45  # 45 minutes = ~4320 requests/month
+    CHECK_INTERVAL_MINUTES = 45  # 45 minutes = ~960 requests/month
+    CHECK_INTERVAL_SECONDS = CHECK_INTERVAL_MINUTES * 60
     
     # Notification settings
     NOTIFICATION_TIMEOUT = 10
@@ -35,10 +46,6 @@ class Config:
     MACOS_SOUND_NAME = "Glass"
     # If terminal-notifier doesn't play a sound, also play via afplay
     MACOS_FORCE_SOUND_WITH_AFLAY = True
-    
-    @property
-    def CHECK_INTERVAL_SECONDS(self):
-        return self.CHECK_INTERVAL_MINUTES * 60
 
 
 config = Config()
@@ -50,26 +57,50 @@ config = Config()
 # Detect OS once at startup
 OS_NAME = platform.system()
 
-# Try to import plyer for Windows notifications
+# Check for plyer (Windows notifications) without importing it; it is loaded on first use
+HAS_PLYER = importlib.util.find_spec("plyer") is not None
+if not HAS_PLYER and OS_NAME == "Windows":
+    print("⚠️  Warning: plyer not installed. Windows notifications disabled.")
+    print("   Install with: pip install plyer")
+
+# Try to import pyobjc for in-process macOS notifications (avoids spawning osascript)
+HAS_PYOBJC = False
+if OS_NAME == "Darwin":
+    try:
+        from Foundation import NSUserNotification, NSUserNotificationCenter
+        HAS_PYOBJC = True
+    except ImportError:
+        pass
+
+# Use orjson for faster response parsing when available
 try:
-    from plyer import notification
-    HAS_PLYER = True
+    import orjson
+    HAS_ORJSON = True
 except ImportError:
-    HAS_PLYER = False
-    if OS_NAME == "Windows":
-        print("⚠️  Warning: plyer not installed. Windows notifications disabled.")
-        print("   Install with: pip install plyer")
+    HAS_ORJSON = False
 
-# Load environment variables
-load_dotenv()
+# Load environment variables (only parse .env, and import dotenv, when the file exists)
+ENV_FILE = Path(__file__).resolve().parent / ".env"
+if ENV_FILE.exists():
+    from dotenv import load_dotenv
+    load_dotenv(ENV_FILE)
 API_KEY = os.getenv('EXCHANGE_RATE_API_KEY')
 
-# Initialize threshold calculator
-calculator = DynamicThresholdCalculator()
+# Threshold calculator, created on first use so threshold_calculator is only imported when needed
+_calculator = None
+
+def get_calculator():
+    """Return the shared DynamicThresholdCalculator, creating it on first call"""
+    global _calculator
+    if _calculator is None:
+        from threshold_calculator import DynamicThresholdCalculator
+        _calculator = DynamicThresholdCalculator()
+    return _calculator
 
 # Load dynamic thresholds or use defaults
 def load_thresholds():
     """Load dynamic thresholds from file or use static defaults"""
+    calculator = get_calculator()
     status = calculator.get_threshold_status()
     
     if status["exists"]:
@@ -89,40 +120,95 @@ def load_thresholds():
             "HKD/JPY": {"min": 18.62, "max": 19.85},
         }
 
+def _to_pips(value):
+    """Convert a rate to integer pips (1 pip = 0.0001), the precision thresholds are stored at"""
+    return int(round(value * 10000))
+
 # Load thresholds at startup
 RULES = load_thresholds()
 
-# Pre-calculate base currencies (avoid recomputing every check)
-BASE_CURRENCIES = set(pair.split('/')[0] for pair in RULES.keys())
+# Split and validate pairs once at startup: (pair, rule, from_currency, to_currency).
+# Each rule is copied with integer min_pips/max_pips (derived from min/max when the
+# file predates them) so threshold checks compare exact integers.
+PAIRS = []
+for _pair, _rule in RULES.items():
+    _parts = _pair.split('/')
+    if len(_parts) == 2 and all(_parts):
+        _rule = {
+            **_rule,
+            "min_pips": _rule.get("min_pips", _to_pips(_rule["min"])),
+            "max_pips": _rule.get("max_pips", _to_pips(_rule["max"])),
+        }
+        PAIRS.append((_pair, _rule, *_parts))
+    else:
+        print(f"⚠️  Skipping malformed currency pair: {_pair!r} (expected 'BASE/TARGET')")
+
+# Currencies to request against the hub (one request covers every pair)
+HUB_SYMBOLS = sorted({ccy for _, _, from_ccy, to_ccy in PAIRS for ccy in (from_ccy, to_ccy)} - {config.BASE_HUB})
+
+# Pre-built alert text per pair: (low title, low message, high title, high message);
+# only the rate is substituted into the titles when an alert fires
+TEMPLATES = {
+    pair: (
+        f"📉 Low Rate Alert: {pair} = %.4f",
+        f"{pair} has fallen below your minimum threshold ({rule['min']})",
+        f"📈 High Rate Alert: {pair} = %.4f",
+        f"{pair} has exceeded your maximum threshold ({rule['max']})",
+    )
+    for pair, rule in RULES.items()
+}
 
 # ============================================================================
 # Platform-Specific Notification Functions
 # ============================================================================
 
+# Resolve macOS notifier and sound paths once (avoids PATH scans and stat() per alert)
+MACOS_SOUND_NAME = getattr(config, 'MACOS_SOUND_NAME', 'Glass') or 'Glass'
+TERMINAL_NOTIFIER_PATH = None
+SOUND_PATH = None
+if OS_NAME == "Darwin":
+    _abs_notifier = "/opt/homebrew/bin/terminal-notifier"
+    TERMINAL_NOTIFIER_PATH = _abs_notifier if os.path.exists(_abs_notifier) else shutil.which('terminal-notifier')
+    _sound_path = f"/System/Library/Sounds/{MACOS_SOUND_NAME}.aiff"
+    if os.path.exists(_sound_path):
+        SOUND_PATH = _sound_path
+
+
 def _notify_macos(title, message):
     """Send notification on macOS.
     Prefer terminal-notifier (if available) for better visibility/sound,
-    and fall back to AppleScript otherwise.
+    then pyobjc's NSUserNotificationCenter (no subprocess), and fall back
+    to AppleScript otherwise.
     """
-    abs_notifier = "/opt/homebrew/bin/terminal-notifier"
-    notifier_path = abs_notifier if os.path.exists(abs_notifier) else shutil.which('terminal-notifier')
-    if notifier_path:
-        sound_name = getattr(config, 'MACOS_SOUND_NAME', 'Glass') or 'Glass'
+    if TERMINAL_NOTIFIER_PATH:
         subprocess.run([
-            notifier_path,
+            TERMINAL_NOTIFIER_PATH,
             '-title', title,
             '-message', message,
-            '-sound', sound_name,
+            '-sound', MACOS_SOUND_NAME,
         ], check=True)
         # Optional: force sound using afplay in case notification sound is muted by system policy
-        if getattr(config, 'MACOS_FORCE_SOUND_WITH_AFLAY', False):
-            sound_path = f"/System/Library/Sounds/{sound_name}.aiff"
-            if os.path.exists(sound_path):
-                try:
-                    subprocess.run(['/usr/bin/afplay', sound_path], check=False)
-                except Exception:
-                    pass
+        if getattr(config, 'MACOS_FORCE_SOUND_WITH_AFLAY', False) and SOUND_PATH:
+            try:
+                subprocess.run(['/usr/bin/afplay', SOUND_PATH], check=False)
+            except Exception:
+                pass
         return
+    # Deliver in-process through Foundation when pyobjc is installed. The center is
+    # None for processes without a bundle identifier (plain or venv python), and the
+    # API is deprecated, so fall through to AppleScript on any failure.
+    if HAS_PYOBJC:
+        try:
+            center = NSUserNotificationCenter.defaultUserNotificationCenter()
+            if center is not None:
+                notice = NSUserNotification.alloc().init()
+                notice.setTitle_(title)
+                notice.setInformativeText_(message)
+                notice.setSoundName_(MACOS_SOUND_NAME)
+                center.deliverNotification_(notice)
+                return
+        except Exception:
+            pass
     # Fallback to AppleScript (use explicit path and JSON to safely escape)
     apple_script = f'display notification {json.dumps(message)} with title {json.dumps(title)}'
     subprocess.run(['/usr/bin/osascript', '-e', apple_script], check=True)
@@ -137,6 +223,7 @@ def _notify_windows(title, message):
     """Send notification on Windows using plyer"""
     if not HAS_PLYER:
         raise RuntimeError("plyer not installed")
+    from plyer import notification
     notification.notify(
         title=title,
         message=message,
@@ -152,6 +239,9 @@ NOTIFIERS = {
     "Windows": _notify_windows,
 }
 
+# Platform notifier bound once at startup (None on unsupported platforms)
+NOTIFIER = NOTIFIERS.get(OS_NAME)
+
 
 # Lightweight info notification wrapper and reminder state
 MONTHLY_REMINDER_SHOWN = False  # show monthly reminder at most once per run
@@ -159,10 +249,9 @@ NEXT_WEEKLY_REMINDER_AT = None  # schedule weekly follow-ups until updated
 
 def notify_info(title, message):
     """Send an informational notification using platform notifier with console fallback."""
-    notifier = NOTIFIERS.get(OS_NAME)
-    if notifier:
+    if NOTIFIER:
         try:
-            notifier(title, message)
+            NOTIFIER(title, message)
             print(f"ℹ️  Reminder shown: {title}")
             return
         except Exception as e:
@@ -172,7 +261,7 @@ def notify_info(title, message):
 def thresholds_outdated_this_month() -> bool:
     """Return True if thresholds are missing or last_updated is before the current month."""
     try:
-        status = calculator.get_threshold_status()
+        status = get_calculator().get_threshold_status()
         if not status.get("exists"):
             return True
         last = datetime.fromisoformat(status.get("last_updated"))
@@ -183,23 +272,34 @@ def thresholds_outdated_this_month() -> bool:
         return True
 
 
+# The outdated check can only change once per day, so memoize it per calendar day
+_outdated_cache = {"date": None, "value": None}
+
+def _outdated_today() -> bool:
+    """Return thresholds_outdated_this_month(), computed at most once per day.
+    Reset _outdated_cache["date"] to None to force a recheck."""
+    today = date.today()
+    if _outdated_cache["date"] != today:
+        _outdated_cache.update(date=today, value=thresholds_outdated_this_month())
+    return _outdated_cache["value"]
+
+
 def send_notification(pair, rate, rule):
     """Send cross-platform notification based on exchange rate thresholds"""
-    # Determine notification content
-    if rate <= rule["min"]:
-        title = f"📉 Low Rate Alert: {pair} = {rate:.4f}"
-        message = f"{pair} has fallen below your minimum threshold ({rule['min']})"
-    elif rate >= rule["max"]:
-        title = f"📈 High Rate Alert: {pair} = {rate:.4f}"
-        message = f"{pair} has exceeded your maximum threshold ({rule['max']})"
+    # Determine notification content (compared in whole pips)
+    rate_pips = _to_pips(rate)
+    if rate_pips <= rule["min_pips"]:
+        title_tmpl, message = TEMPLATES[pair][:2]
+    elif rate_pips >= rule["max_pips"]:
+        title_tmpl, message = TEMPLATES[pair][2:]
     else:
         return  # Don't send notification if within threshold
+    title = title_tmpl % rate
     
     # Try platform-specific notification
-    notifier = NOTIFIERS.get(OS_NAME)
-    if notifier:
+    if NOTIFIER:
         try:
-            notifier(title, message)
+            NOTIFIER(title, message)
             print(f"✅ Notification sent: {title}")
             return
         except FileNotFoundError:
@@ -218,12 +318,37 @@ def send_notification(pair, rate, rule):
 # API Fetching Functions
 # ============================================================================
 
+# Shared HTTP session: keep-alive reuses one TLS connection per API host
+# across checks instead of a handshake per request. Transient failures are
+# retried on the same provider (with backoff, honouring Retry-After) before
+# check_rates falls back to the backup API.
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 502, 503, 504],
+        allowed_methods=['GET'],
+        respect_retry_after_header=True,
+    ),
+))
+SESSION.headers.update({
+    'Accept-Encoding': 'gzip, deflate',
+    'Accept': 'application/json',
+    'User-Agent': 'ExchangeRateMonitor/1.0',
+})
+atexit.register(SESSION.close)
+
+
 def _fetch_api(url, parser_func, api_name):
     """Unified API fetching wrapper with error handling"""
     try:
-        response = requests.get(url, timeout=config.API_TIMEOUT)
+        response = SESSION.get(url, timeout=config.API_TIMEOUT)
         if response.status_code == 200:
-            return parser_func(response.json())
+            data = orjson.loads(response.content) if HAS_ORJSON else response.json()
+            return parser_func(data)
         else:
             print(f"⚠️  {api_name} returned status {response.status_code}")
             return None
@@ -241,7 +366,7 @@ def _fetch_api(url, parser_func, api_name):
 def fetch_rates_frankfurter(base):
     """Fetch rates from Frankfurter API (Primary, no key needed)"""
     return _fetch_api(
-        url=f"https://api.frankfurter.app/latest?from={base}",
+        url=f"https://api.frankfurter.app/latest?from={base}&to={','.join(HUB_SYMBOLS)}",
         parser_func=lambda data: data.get("rates", {}),
         api_name=f"Frankfurter API ({base})"
     )
@@ -269,91 +394,165 @@ def fetch_rates_exchangerate_api(base):
 # Main Monitoring Logic
 # ============================================================================
 
-def check_rates():
-    """Check exchange rates for monitored currency pairs"""
-    rates_cache = {}
-    
-    # Fetch rates for all base currencies
-    for base in BASE_CURRENCIES:
-        rates = None
+def _fetch_with_fallback(base):
+    """Fetch rates for one base currency, falling back to the backup API on failure"""
+    # Try primary API first
+    if config.USE_FRANKFURTER_FIRST:
+        rates = fetch_rates_frankfurter(base)
         
-        # Try primary API first
-        if config.USE_FRANKFURTER_FIRST:
-            rates = fetch_rates_frankfurter(base)
-            
-            # If primary fails, try backup API
-            if rates is None and API_KEY:
-                print(f"🔄 Switching to backup API for {base}...")
-                rates = fetch_rates_exchangerate_api(base)
-        else:
-            # Use ExchangeRate-API as primary
+        # If primary fails, try backup API
+        if rates is None and API_KEY:
+            print(f"🔄 Switching to backup API for {base}...")
             rates = fetch_rates_exchangerate_api(base)
-            
-            # If primary fails, try Frankfurter as backup
-            if rates is None:
-                print(f"🔄 Switching to Frankfurter API for {base}...")
-                rates = fetch_rates_frankfurter(base)
+    else:
+        # Use ExchangeRate-API as primary
+        rates = fetch_rates_exchangerate_api(base)
         
-        if rates:
-            rates_cache[base] = rates
+        # If primary fails, try Frankfurter as backup
+        if rates is None:
+            print(f"🔄 Switching to Frankfurter API for {base}...")
+            rates = fetch_rates_frankfurter(base)
+    
+    return rates
+
+
+# Rate cache: base -> (fetched_at, rates), persisted to disk so a restart
+# within the TTL reuses the last response instead of fetching again
+RATES_CACHE_FILE = get_calculator().cache_dir / "rates_cache.json"
+
+def _load_rates_cache():
+    """Load persisted rates from disk; a missing, unreadable or malformed file yields an empty cache"""
+    try:
+        with open(RATES_CACHE_FILE, 'r') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    
+    # Each entry must be [fetched_at (number), rates (dict)]; drop the whole cache otherwise
+    cache = {}
+    for base, entry in data.items():
+        if not (isinstance(entry, list) and len(entry) == 2):
+            return {}
+        fetched_at, rates = entry
+        if isinstance(fetched_at, bool) or not isinstance(fetched_at, (int, float)) or not isinstance(rates, dict):
+            return {}
+        cache[base] = (float(fetched_at), rates)
+    return cache
+
+
+def _store_rates(base, rates):
+    """Record freshly fetched rates and write the cache to disk atomically (best effort)"""
+    RATES_CACHE[base] = (time.time(), rates)
+    tmp_file = RATES_CACHE_FILE.with_suffix('.json.tmp')
+    try:
+        with open(tmp_file, 'w') as f:
+            json.dump(RATES_CACHE, f)
+        os.replace(tmp_file, RATES_CACHE_FILE)
+    except OSError as e:
+        print(f"⚠️  Could not save rate cache: {e}")
+
+
+RATES_CACHE = _load_rates_cache()
+_HUB_SYMBOL_SET = set(HUB_SYMBOLS)
+
+def get_rates_cached(base, ttl=config.RATES_CACHE_TTL_SECONDS):
+    """Return rates for a base currency, reusing a cached response younger than ttl seconds.
+    A cached table missing any currency in HUB_SYMBOLS (e.g. a pair was added since it
+    was fetched) counts as a miss, as does one stamped in the future (clock change or a
+    copied cache file)."""
+    cached = RATES_CACHE.get(base)
+    if cached and 0 <= time.time() - cached[0] < ttl and cached[1].keys() >= _HUB_SYMBOL_SET:
+        return cached[1]
+    
+    rates = _fetch_with_fallback(base)
+    if rates:
+        _store_rates(base, rates)
+    return rates
+
+
+def _cross_rate(hub_rates, from_currency, to_currency):
+    """Derive from/to from hub-quoted rates (hub/from and hub/to); None if either is missing"""
+    hub = config.BASE_HUB
+    from_rate = 1.0 if from_currency == hub else hub_rates.get(from_currency)
+    to_rate = 1.0 if to_currency == hub else hub_rates.get(to_currency)
+    if not from_rate or to_rate is None:
+        return None
+    return to_rate / from_rate
+
+
+def check_rates():
+    """Check exchange rates for monitored currency pairs"""
+    # Fetch all rates in a single request against the hub currency
+    hub_rates = get_rates_cached(config.BASE_HUB)
     
     # Check if we got any data at all
-    if not rates_cache:
+    if not hub_rates:
         print("❌ Unable to fetch any exchange rates. Check your internet connection.")
         return
     
+    # All pairs in a cycle share one timestamp
+    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    
+    # Collect log lines and write them in one call at the end
+    out = []
+    
     # Check each currency pair against thresholds
-    for pair, rule in RULES.items():
-        from_currency, to_currency = pair.split('/')
-        
-        if from_currency in rates_cache and to_currency in rates_cache[from_currency]:
-            rate = rates_cache[from_currency][to_currency]
-            
+    for pair, rule, from_currency, to_currency in PAIRS:
+        rate = _cross_rate(hub_rates, from_currency, to_currency)
+        if rate is not None:
             # Send notification if threshold crossed
             send_notification(pair, rate, rule)
             
             # Log to console
-            timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            print(f"{timestamp} - {pair}: {rate:.4f} (Alert range: {rule['min']} - {rule['max']})")
+            out.append(f"{timestamp} - {pair}: {rate:.4f} (Alert range: {rule['min']} - {rule['max']})")
         else:
-            print(f"⚠️  No data available for {pair}")
+            out.append(f"⚠️  No data available for {pair}")
+    
+    sys.stdout.write('\n'.join(out) + '\n')
+
+# API usage and startup banner are fixed for the process lifetime, so build them once
+CHECKS_PER_DAY: Final = (24 * 60) // config.CHECK_INTERVAL_MINUTES
+API_CALLS_PER_DAY: Final = CHECKS_PER_DAY  # one hub request per check
+API_CALLS_PER_MONTH: Final = API_CALLS_PER_DAY * 30
+
+if config.USE_FRANKFURTER_FIRST:
+    _API_LINES = [
+        "🔑 Primary API: Frankfurter.app (Free, ~5,000 requests/month)",
+        "🔐 Backup API: ExchangeRate-API.com (1,500 requests/month)" if API_KEY
+        else "💡 Backup API: Not configured (optional)",
+    ]
+else:
+    _API_LINES = [
+        "🔑 Primary API: ExchangeRate-API.com (1,500 requests/month)",
+        "🔐 Backup API: Frankfurter.app (~5,000 requests/month)",
+    ]
+
+_BANNER: Final = "\n".join([
+    "=" * 70,
+    "🚀 Exchange Rate Monitor Started",
+    f"🖥️  Platform: {OS_NAME}",
+    f"📊 Watching {len(PAIRS)} currency pairs",
+    "=" * 70,
+    *_API_LINES,
+    f"⏰ Check interval: {config.CHECK_INTERVAL_MINUTES} minutes",
+    f"📈 Daily checks: ~{CHECKS_PER_DAY} times ({API_CALLS_PER_DAY} API calls/day)",
+    f"📊 Monthly usage: ~{API_CALLS_PER_MONTH} API calls/month",
+    "=" * 70,
+    "",
+])
+
 
 def main():
     """Main monitoring loop"""
-    # Calculate API usage
-    checks_per_day = (24 * 60) // config.CHECK_INTERVAL_MINUTES
-    api_calls_per_day = checks_per_day * len(BASE_CURRENCIES)
-    api_calls_per_month = api_calls_per_day * 30
-    
     # Print startup info
-    print("=" * 70)
-    print(f"🚀 Exchange Rate Monitor Started")
-    print(f"🖥️  Platform: {OS_NAME}")
-    print(f"📊 Watching {len(RULES)} currency pairs")
-    print("=" * 70)
-    
-    # API configuration
-    if config.USE_FRANKFURTER_FIRST:
-        print(f"🔑 Primary API: Frankfurter.app (Free, ~5,000 requests/month)")
-        if API_KEY:
-            print(f"🔐 Backup API: ExchangeRate-API.com (1,500 requests/month)")
-        else:
-            print(f"💡 Backup API: Not configured (optional)")
-    else:
-        print(f"🔑 Primary API: ExchangeRate-API.com (1,500 requests/month)")
-        print(f"🔐 Backup API: Frankfurter.app (~5,000 requests/month)")
-    
-    # Monitoring schedule
-    print(f"⏰ Check interval: {config.CHECK_INTERVAL_MINUTES} minutes")
-    print(f"📈 Daily checks: ~{checks_per_day} times ({api_calls_per_day} API calls/day)")
-    print(f"📊 Monthly usage: ~{api_calls_per_month} API calls/month")
-    print("=" * 70)
-    print()
+    print(_BANNER)
     
     # Gentle monthly reminder (once per run on the 1st), plus weekly follow-ups if still outdated
     global MONTHLY_REMINDER_SHOWN, NEXT_WEEKLY_REMINDER_AT
     now = datetime.now()
-    if now.day == 1 and not MONTHLY_REMINDER_SHOWN and thresholds_outdated_this_month():
+    if now.day == 1 and not MONTHLY_REMINDER_SHOWN and _outdated_today():
         notify_info(
             "Time to update thresholds",
             "It's the 1st of the month.\nRun: python update_thresholds.py"
@@ -362,12 +561,13 @@ def main():
         # schedule first weekly follow-up in 7 days
         NEXT_WEEKLY_REMINDER_AT = now + timedelta(days=7)
     
-    # Main monitoring loop
+    # Main monitoring loop (scheduled against a monotonic deadline so check time doesn't drift the cadence)
+    next_at = time.monotonic()
     try:
         while True:
             check_rates()
             # Weekly follow-up if still outdated (only once per 7 days)
-            if thresholds_outdated_this_month() and NEXT_WEEKLY_REMINDER_AT is not None:
+            if NEXT_WEEKLY_REMINDER_AT is not None and _outdated_today():
                 if datetime.now() >= NEXT_WEEKLY_REMINDER_AT:
                     notify_info(
                         "Reminder: update thresholds",
@@ -375,13 +575,53 @@ def main():
                     )
                     NEXT_WEEKLY_REMINDER_AT = datetime.now() + timedelta(days=7)
             print(f"\n⏳ Next check in {config.CHECK_INTERVAL_MINUTES} minutes...\n")
-            time.sleep(config.CHECK_INTERVAL_SECONDS)
+            # stdout is block-buffered when redirected (e.g. launchd log files), so the
+            # cycle's output goes out in one write; flush it before going idle
+            sys.stdout.flush()
+            next_at += config.CHECK_INTERVAL_SECONDS
+            delay = next_at - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                # Check overran the interval: skip missed ticks instead of firing back-to-back
+                next_at = time.monotonic()
     except KeyboardInterrupt:
         print("\n✅ Exchange Rate Monitor Stopped")
     except Exception as e:
         print(f"\n❌ Unexpected error: {e}")
         print("Monitor stopped. Please check logs and restart.")
 
+# ============================================================================
+# macOS Autostart (launchd)
+# ============================================================================
+
+LAUNCHD_LABEL = "com.simplereminder.exchangerate"
+
+_PLIST_TEMPLATE = string.Template("""<?xml version="1.0" encoding="UTF-8"?>
+<!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN" "http://www.apple.com/DTDs/PropertyList-1.0.dtd">
+<plist version="1.0">
+<dict>
+    <key>Label</key>
+    <string>$label</string>
+    <key>ProgramArguments</key>
+    <array>
+        <string>$python_bin</string>
+        <string>$script_path</string>
+    </array>
+    <key>WorkingDirectory</key>
+    <string>$project_dir</string>
+    <key>RunAtLoad</key>
+    <true/>
+    <key>KeepAlive</key>
+    <true/>
+    <key>StandardOutPath</key>
+    <string>$project_dir/exchange_rate.out.log</string>
+    <key>StandardErrorPath</key>
+    <string>$project_dir/exchange_rate.err.log</string>
+</dict>
+</plist>
+""")
+
 if __name__ == "__main__":
     # ----------------------------------------------------------------------
     # Optional: manage macOS autostart via launchd
@@ -393,7 +633,7 @@ if __name__ == "__main__":
     args = parser.parse_args()
 
     def _plist_path() -> Path:
-        return Path.home() / "Library" / "LaunchAgents" / "com.simplereminder.exchangerate.plist"
+        return Path.home() / "Library" / "LaunchAgents" / f"{LAUNCHD_LABEL}.plist"
 
     def _ensure_plist():
         project_dir = Path(__file__).resolve().parent
@@ -402,31 +642,16 @@ if __name__ == "__main__":
             # Fallback to current interpreter
             python_bin = Path(os.sys.executable)
         script_path = Path(__file__).resolve()
-        plist_content = f"""<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN" "http://www.apple.com/DTDs/PropertyList-1.0.dtd">
-<plist version="1.0">
-<dict>
-    <key>Label</key>
-    <string>com.simplereminder.exchangerate</string>
-    <key>ProgramArguments</key>
-    <array>
-        <string>{python_bin}</string>
-        <string>{script_path}</string>
-    </array>
-    <key>WorkingDirectory</key>
-    <string>{project_dir}</string>
-    <key>RunAtLoad</key>
-    <true/>
-    <key>KeepAlive</key>
-    <true/>
-    <key>StandardOutPath</key>
-    <string>{project_dir}/exchange_rate.out.log</string>
-    <key>StandardErrorPath</key>
-    <string>{project_dir}/exchange_rate.err.log</string>
-</dict>
-</plist>
-"""
+        plist_content = _PLIST_TEMPLATE.substitute(
+            label=LAUNCHD_LABEL,
+            python_bin=python_bin,
+            script_path=script_path,
+            project_dir=project_dir,
+        )
         plist_path = _plist_path()
+        # Skip the write when the installed plist is already identical
+        if plist_path.exists() and plist_path.read_text() == plist_content:
+            return plist_path
         plist_path.parent.mkdir(parents=True, exist_ok=True)
         plist_path.write_text(plist_content)
         return plist_path
@@ -438,16 +663,32 @@ if __name__ == "__main__":
         except Exception:
             return False
 
+    def _is_loaded(label=LAUNCHD_LABEL) -> bool:
+        """Return True if launchd currently has the service loaded"""
+        try:
+            result = subprocess.run(["launchctl", "list", label],
+                                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            return result.returncode == 0
+        except Exception:
+            return False
+
     if OS_NAME == "Darwin":
         if args.install_autostart:
-            plist_path = _ensure_plist()
-            _launchctl("unload", str(plist_path))  # unload if already loaded
+            # Probe launchd while the plist is written (the probe only uses the label)
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                fut_plist = executor.submit(_ensure_plist)
+                fut_loaded = executor.submit(_is_loaded)
+                plist_path = fut_plist.result()
+                loaded = fut_loaded.result()
+            if loaded:
+                _launchctl("unload", str(plist_path))  # reload to pick up changes
             ok = _launchctl("load", str(plist_path))
             print("✅ Autostart installed and loaded" if ok else "⚠️ Failed to load launchd service")
             exit(0)
         if args.remove_autostart:
             plist_path = _plist_path()
-            _launchctl("unload", str(plist_path))
+            if _is_loaded():
+                _launchctl("unload", str(plist_path))
             if plist_path.exists():
                 try:
                     plist_path.unlink()
@@ -463,7 +704,7 @@ if __name__ == "__main__":
             print(f"Plist: {plist_path} -> {'present' if exists else 'missing'}")
             if exists:
                 # best-effort check
-                _launchctl("print", f"gui/{os.getuid()}/com.simplereminder.exchangerate")
+                _launchctl("print", f"gui/{os.getuid()}/{LAUNCHD_LABEL}")
             exit(0)
 
     # Run the normal monitor
@@ -6,18 +6,59 @@ Uses percentile method to calculate thresholds based on historical data
 """
 
 import json
+import os
 import requests
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Use orjson for faster parsing when available
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 
 class DynamicThresholdCalculator:
     """Calculate dynamic thresholds using percentile method"""
     
+    # Upper bound on concurrent historical requests (keeps within Frankfurter rate limits)
+    MAX_CONCURRENT_REQUESTS = 4
+    
+    # Bump when the history cache layout changes; a mismatch triggers a full refetch
+    HISTORY_SCHEMA_VERSION = 1
+    
+    # A cached series must start within this many days of the lookback window
+    # (weekends/holidays have no rates) to be reused; otherwise the window is refetched
+    HISTORY_COVERAGE_SLACK_DAYS = 7
+    
     def __init__(self, cache_dir="data"):
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(exist_ok=True)
         self.thresholds_file = self.cache_dir / "thresholds.json"
+        
+        # Parsed thresholds, reused until the file's mtime changes
+        self._thr_cache = None
+        self._thr_mtime = 0
+        
+        # Per-pair daily rate history, so updates only fetch days not seen before
+        self.history_file = self.cache_dir / "history.json"
+        self._history = None
+        self._history_lock = threading.Lock()
+        
+        # Persistent session: keep-alive reuses one connection to Frankfurter for all pairs
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=8,
+            max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504]),
+        ))
+        self.session.headers.update({"Connection": "keep-alive", "Accept-Encoding": "gzip"})
     
     def fetch_historical_data(self, base, target, days=365):
         """
@@ -31,36 +72,116 @@ class DynamicThresholdCalculator:
         Returns:
             List of exchange rates
         """
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=days)
+        return self.fetch_historical_data_multi(base, [target], days)[target]
+    
+    def fetch_historical_data_multi(self, base, targets, days=365):
+        """
+        Fetch historical exchange rate data for several targets of one base in a single request
         
-        url = f"https://api.frankfurter.app/{start_date.strftime('%Y-%m-%d')}..{end_date.strftime('%Y-%m-%d')}"
-        params = {"from": base, "to": target}
+        Dates already in the history cache are not requested again; only
+        the days since the last cached date are fetched, then each series
+        is trimmed to the lookback window and saved back.
         
-        print(f"   📥 Fetching {days} days of historical data...")
-        response = requests.get(url, params=params, timeout=30)
-        data = response.json()
+        Args:
+            base: Base currency (e.g., 'AUD')
+            targets: Target currencies (e.g., ['CNY', 'HKD'])
+            days: Number of days to look back (default: 365)
         
-        # Extract rates from all dates
-        rates = []
-        for date in sorted(data["rates"].keys()):
-            if target in data["rates"][date]:
-                rates.append(data["rates"][date][target])
+        Returns:
+            Dictionary mapping each target to its list of exchange rates
+        """
+        end_date = datetime.now()
+        start_date = end_date - timedelta(days=days)
+        window_start = start_date.strftime('%Y-%m-%d')
+        
+        # Cached rates inside the lookback window: {target: {date: rate}}
+        with self._history_lock:
+            history = self._load_history()
+            series = {
+                target: {date: rate for date, rate in history.get(f"{base}/{target}", {}).items() if date >= window_start}
+                for target in targets
+            }
         
-        return rates
+        # Reuse the cache only if every series reaches back to the window start
+        # (e.g. not after a run with a shorter lookback); otherwise fetch the full window
+        coverage_limit = (start_date + timedelta(days=self.HISTORY_COVERAGE_SLACK_DAYS)).strftime('%Y-%m-%d')
+        if not all(target_series and next(iter(target_series)) <= coverage_limit for target_series in series.values()):
+            series = {target: {} for target in targets}
+        
+        # Series are kept in date order, so the last key is the newest cached date
+        last_dates = {target: next(reversed(target_series), "") for target, target_series in series.items()}
+        
+        # Only request the days after the last date cached for every target
+        if all(last_dates.values()):
+            last_cached = datetime.strptime(min(last_dates.values()), '%Y-%m-%d')
+            start_date = max(start_date, last_cached + timedelta(days=1))
+        
+        if start_date.date() <= end_date.date():
+            url = f"https://api.frankfurter.app/{start_date.strftime('%Y-%m-%d')}..{end_date.strftime('%Y-%m-%d')}"
+            params = {"from": base, "to": ",".join(targets)}
+            
+            response = self.session.get(url, params=params, timeout=30)
+            response.raise_for_status()
+            data = response.json()
+            
+            # Frankfurter returns dates in ascending order, so appending newer
+            # dates keeps each series sorted without re-sorting
+            for date, day_rates in data.get("rates", {}).items():
+                if date < window_start:
+                    continue
+                for target in targets:
+                    if target in day_rates and date > last_dates[target]:
+                        series[target][date] = day_rates[target]
+        
+        with self._history_lock:
+            for target, target_series in series.items():
+                self._history[f"{base}/{target}"] = target_series
+            self._save_history()
+        
+        return {target: list(target_series.values()) for target, target_series in series.items()}
+    
+    def _load_history(self):
+        """Load the rate history cache once; a missing, corrupt or outdated file yields an empty cache"""
+        if self._history is None:
+            self._history = {}
+            try:
+                with open(self.history_file, 'r') as f:
+                    cache = json.load(f)
+            except (OSError, ValueError):
+                return self._history
+            if not isinstance(cache, dict) or cache.get("version") != self.HISTORY_SCHEMA_VERSION:
+                return self._history
+            
+            # "pairs" must map each pair to a {date: rate} dict; anything else discards the cache
+            pairs = cache.get("pairs")
+            if isinstance(pairs, dict) and all(
+                isinstance(series, dict)
+                and all(isinstance(rate, (int, float)) and not isinstance(rate, bool) for rate in series.values())
+                for series in pairs.values()
+            ):
+                self._history = pairs
+        return self._history
+    
+    def _save_history(self):
+        """Write the rate history cache to disk (atomically, like thresholds.json)"""
+        tmp_file = self.history_file.with_suffix('.json.tmp')
+        with open(tmp_file, 'w') as f:
+            json.dump({"version": self.HISTORY_SCHEMA_VERSION, "pairs": self._history}, f)
+        os.replace(tmp_file, self.history_file)
     
-    def calculate_percentile_threshold(self, rates, percentile):
+    def calculate_percentile_threshold(self, rates, percentile, presorted=False):
         """
         Calculate threshold at given percentile
         
         Args:
             rates: List of exchange rates
             percentile: Percentile value (e.g., 10 for 10th percentile)
+            presorted: Set if rates is already in ascending order (skips the sort)
         
         Returns:
             Threshold value at the percentile
         """
-        rates_sorted = sorted(rates)
+        rates_sorted = rates if presorted else sorted(rates)
         n = len(rates_sorted)
         index = int(n * percentile / 100)
         
@@ -69,7 +190,7 @@ class DynamicThresholdCalculator:
         
         return rates_sorted[index]
     
-    def calculate_thresholds(self, pair, percentile=10, lookback_days=365):
+    def calculate_thresholds(self, pair, percentile=10, lookback_days=365, rates=None):
         """
         Calculate min/max thresholds for a currency pair
         
@@ -77,30 +198,38 @@ class DynamicThresholdCalculator:
             pair: Currency pair string (e.g., 'AUD/CNY')
             percentile: Percentile to use (default: 10)
             lookback_days: Days of historical data (default: 365)
+            rates: Pre-fetched historical rates (fetched when omitted)
         
         Returns:
             Dictionary with threshold information
         """
-        base, target = pair.split('/')
-        
         # Fetch historical data
-        rates = self.fetch_historical_data(base, target, lookback_days)
+        if rates is None:
+            base, target = pair.split('/')
+            rates = self.fetch_historical_data(base, target, lookback_days)
         
         if not rates:
             raise ValueError(f"No historical data available for {pair}")
         
-        # Calculate percentile thresholds
-        lower_threshold = self.calculate_percentile_threshold(rates, percentile)
-        upper_threshold = self.calculate_percentile_threshold(rates, 100 - percentile)
+        # Sort once and read both percentiles and the extremes from it
+        rates_sorted = sorted(rates)
+        lower_threshold = self.calculate_percentile_threshold(rates_sorted, percentile, presorted=True)
+        upper_threshold = self.calculate_percentile_threshold(rates_sorted, 100 - percentile, presorted=True)
         
         # Calculate additional stats
         mean_rate = sum(rates) / len(rates)
-        min_rate = min(rates)
-        max_rate = max(rates)
+        min_rate = rates_sorted[0]
+        max_rate = rates_sorted[-1]
+        min_value = round(lower_threshold, 4)
+        max_value = round(upper_threshold, 4)
         
         return {
-            "min": round(lower_threshold, 4),
-            "max": round(upper_threshold, 4),
+            "min": min_value,
+            "max": max_value,
+            # Same thresholds as integer pips (1 pip = 0.0001) for exact comparisons;
+            # derived from the stored values so both fields always agree
+            "min_pips": int(round(min_value * 10000)),
+            "max_pips": int(round(max_value * 10000)),
             "mean": round(mean_rate, 4),
             "historical_min": round(min_rate, 4),
             "historical_max": round(max_rate, 4),
@@ -110,7 +239,7 @@ class DynamicThresholdCalculator:
             "last_updated": datetime.now().isoformat()
         }
     
-    def update_all_thresholds(self, currency_pairs, percentile=10, lookback_days=365):
+    def update_all_thresholds(self, currency_pairs, percentile=10, lookback_days=365, refresh_after_hours=24):
         """
         Update thresholds for all currency pairs
         
@@ -118,6 +247,9 @@ class DynamicThresholdCalculator:
             currency_pairs: List of currency pair strings
             percentile: Percentile to use (default: 10)
             lookback_days: Days of historical data (default: 365)
+            refresh_after_hours: Reuse saved thresholds computed with the same
+                settings within this many hours (and in the current calendar month)
+                instead of refetching; 0 forces a full update (default: 24)
         
         Returns:
             Dictionary of all thresholds
@@ -131,10 +263,70 @@ class DynamicThresholdCalculator:
         print("=" * 70)
         print()
         
+        # Reuse recent entries computed with the same settings (skips fetch and recompute).
+        # An unreadable or malformed file just means nothing is reused, so this run can repair it.
+        try:
+            existing = self.load_thresholds()
+        except (OSError, ValueError):
+            existing = {}
+        if not isinstance(existing, dict):
+            existing = {}
+        # Never reuse entries from a previous month: the monitor's monthly reminder
+        # checks last_updated, and a reused entry would keep it firing
+        now = datetime.now()
+        fresh_after = max(
+            now - timedelta(hours=refresh_after_hours),
+            now.replace(day=1, hour=0, minute=0, second=0, microsecond=0),
+        )
+        reused = {
+            pair: existing[pair] for pair in currency_pairs
+            if refresh_after_hours > 0
+            and self._is_fresh(existing.get(pair), percentile, lookback_days, fresh_after)
+        }
+        
+        # Validate and group the remaining pairs by base currency so each base needs a
+        # single request; malformed pairs are reported below instead of aborting the update
+        targets_by_base = defaultdict(list)
+        split_pairs = {}
+        errors = {}
+        for pair in currency_pairs:
+            if pair in reused:
+                continue
+            parts = pair.split('/')
+            if len(parts) != 2 or not all(parts):
+                errors[pair] = f"Invalid currency pair {pair!r} (expected 'BASE/TARGET')"
+                continue
+            split_pairs[pair] = parts
+            targets_by_base[parts[0]].append(parts[1])
+        
+        # Fetch all bases concurrently (network-bound), then report in order
+        if targets_by_base:
+            print(f"📥 Fetching {lookback_days} days of historical data for {len(split_pairs)} pairs...")
+            print()
+        with ThreadPoolExecutor(max_workers=self.MAX_CONCURRENT_REQUESTS) as executor:
+            futures = {
+                base: executor.submit(self.fetch_historical_data_multi, base, targets, lookback_days)
+                for base, targets in targets_by_base.items()
+            }
+        
         for pair in currency_pairs:
             print(f"📈 Processing {pair}...")
+            if pair in reused:
+                thresholds[pair] = reused[pair]
+                print(f"   ♻️  Up to date (updated {reused[pair]['last_updated']}), skipping fetch")
+                print(f"   ✅ Thresholds: {thresholds[pair]['min']} - {thresholds[pair]['max']}")
+                print()
+                continue
+            
+            if pair in errors:
+                print(f"   ❌ Error: {errors[pair]}")
+                print()
+                continue
+            
+            base, target = split_pairs[pair]
             try:
-                thresholds[pair] = self.calculate_thresholds(pair, percentile, lookback_days)
+                rates = futures[base].result()[target]
+                thresholds[pair] = self.calculate_thresholds(pair, percentile, lookback_days, rates=rates)
                 
                 print(f"   ✅ Thresholds: {thresholds[pair]['min']} - {thresholds[pair]['max']}")
                 print(f"   📊 Based on {thresholds[pair]['data_points']} data points")
@@ -145,26 +337,59 @@ class DynamicThresholdCalculator:
                 print(f"   ❌ Error: {e}")
                 print()
         
-        # Save to file
-        self.save_thresholds(thresholds)
-        
+        # Save to file, unless every entry was reused and the file already holds exactly these pairs
         print("=" * 70)
-        print(f"✅ Thresholds updated and saved to {self.thresholds_file}")
+        if len(reused) == len(thresholds) and set(thresholds) == set(existing):
+            print(f"✅ Thresholds already up to date in {self.thresholds_file}")
+        else:
+            self.save_thresholds(thresholds)
+            print(f"✅ Thresholds updated and saved to {self.thresholds_file}")
         print("=" * 70)
         
         return thresholds
     
+    @staticmethod
+    def _is_fresh(entry, percentile, lookback_days, fresh_after):
+        """Return True if a saved threshold entry matches the settings and was updated after fresh_after"""
+        try:
+            return (
+                entry["percentile"] == percentile
+                and entry["lookback_days"] == lookback_days
+                and datetime.fromisoformat(entry["last_updated"]) >= fresh_after
+            )
+        except (KeyError, TypeError, ValueError):
+            return False
+    
     def save_thresholds(self, thresholds):
-        """Save thresholds to JSON file"""
-        with open(self.thresholds_file, 'w') as f:
-            json.dump(thresholds, f, indent=2)
+        """Save thresholds to JSON file (written to a temp file, then atomically replaced)"""
+        if HAS_ORJSON:
+            data = orjson.dumps(thresholds, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(thresholds, indent=2).encode()
+        
+        tmp_file = self.thresholds_file.with_suffix('.json.tmp')
+        tmp_file.write_bytes(data)
+        os.replace(tmp_file, self.thresholds_file)
     
     def load_thresholds(self):
-        """Load cached thresholds from file"""
-        if self.thresholds_file.exists():
+        """Load cached thresholds from file (re-parsed only when the file changes on disk)"""
+        try:
+            st = self.thresholds_file.stat()
+        except FileNotFoundError:
+            return {}
+        
+        if st.st_mtime_ns == self._thr_mtime and self._thr_cache is not None:
+            return self._thr_cache
+        
+        if HAS_ORJSON:
+            thresholds = orjson.loads(self.thresholds_file.read_bytes())
+        else:
             with open(self.thresholds_file, 'r') as f:
-                return json.load(f)
-        return {}
+                thresholds = json.load(f)
+        
+        self._thr_cache = thresholds
+        self._thr_mtime = st.st_mtime_ns
+        return thresholds
     
     def should_update(self, day_of_month=1):
         """
@@ -5,6 +5,8 @@ Threshold Update Script
 Run this manually or automatically (first day of each month) to update thresholds
 """
 
+import argparse
+
 from threshold_calculator import DynamicThresholdCalculator
 
 # Configuration
@@ -22,6 +24,10 @@ LOOKBACK_DAYS = 365  # One year of historical data
 
 def main():
     """Update all thresholds"""
+    parser = argparse.ArgumentParser(description="Update dynamic exchange rate thresholds")
+    parser.add_argument("--force", action="store_true", help="Recompute all pairs even if updated within the last 24 hours")
+    args = parser.parse_args()
+    
     print("🚀 Dynamic Threshold Update Tool")
     print()
     
@@ -31,7 +37,8 @@ def main():
     thresholds = calculator.update_all_thresholds(
         currency_pairs=CURRENCY_PAIRS,
         percentile=PERCENTILE,
-        lookback_days=LOOKBACK_DAYS
+        lookback_days=LOOKBACK_DAYS,
+        refresh_after_hours=0 if args.force else 24
     )
     
     print()